@@ -12,41 +12,50 @@ Key features:
 - Container execution commands
 
 Usage:
-    python examples/example_cpln_containers.py [gvc-name] [workload-name]
+    python examples/example_cpln_containers.py [-v] [gvc-name] [workload-name]
 """
 
+import argparse
 import os
 import sys
+from typing import Optional, TextIO
 
-# Add the src directory to the path to import cpln
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
-# ruff: noqa: E402
 import cpln
-from cpln.config import WorkloadConfig
-
-
-def list_workload_containers(
-    client: cpln.CPLNClient, gvc_name: str, workload_name: str
-):
+from cpln.models.workloads import Workload
+from cpln.parsers.container import Container
+
+# Output for one container spec, written in a single call per container
+CONTAINER_SPEC_TEMPLATE = (
+    "  ├─ Container: {name}\n"
+    "  │  Image: {image}\n"
+    "  │  CPU: {cpu}\n"
+    "  │  Memory: {memory}\n"
+    "{ports}"
+    "  │  Inherit Env: {inherit_env}\n"
+    "  │\n"
+)
+PORT_TEMPLATE = "  │    {number}/{protocol}\n"
+
+# Rows of the cross-workload container summary
+WORKLOAD_SUMMARY_TEMPLATE = "  ├─ {name}: {count} containers\n"
+CONTAINER_SUMMARY_TEMPLATE = "     └─ {name} ({image})\n"
+
+
+def list_workload_containers(workload: Workload, verbose: bool = True):
     """
     List container specifications for a specific workload.
 
     Args:
-        client: CPLN client instance
-        gvc_name: Name of the GVC
-        workload_name: Name of the specific workload
+        workload: The workload to list containers for
+        verbose: Whether to print each container's spec, or only the totals
 
     Returns:
         List of container specifications for the workload
     """
+    workload_name = workload.attrs["name"]
     print(f"\n=== Listing container specs for workload: {workload_name} ===")
 
     try:
-        # Create config and get the workload
-        config = WorkloadConfig(gvc=gvc_name, workload_id=workload_name)
-        workload = client.workloads.get(config)
-
         # Get container specifications from the workload spec
         containers = workload.get_containers()
 
@@ -55,20 +64,29 @@ def list_workload_containers(
                 f"\n📦 Workload: {workload.attrs['name']} ({len(containers)} container specs)"
             )
 
-            for container in containers:
-                print(f"  ├─ Container: {container.name}")
-                print(f"  │  Image: {container.image}")
-                print(f"  │  CPU: {container.cpu}")
-                print(f"  │  Memory: {container.memory}")
-
-                # Show ports if any
-                if container.ports:
-                    print(f"  │  Ports: {len(container.ports)}")
-                    for port in container.ports:
-                        print(f"  │    {port.number}/{port.protocol}")
-
-                print(f"  │  Inherit Env: {container.inherit_env}")
-                print("  │")
+            # Nobody reads the per-container detail when the output is piped
+            if verbose:
+                for container in containers:
+                    # Show ports if any
+                    ports = ""
+                    if container.ports:
+                        ports = f"  │  Ports: {len(container.ports)}\n" + "".join(
+                            PORT_TEMPLATE.format(
+                                number=port.number, protocol=port.protocol
+                            )
+                            for port in container.ports
+                        )
+
+                    sys.stdout.write(
+                        CONTAINER_SPEC_TEMPLATE.format(
+                            name=container.name,
+                            image=container.image,
+                            cpu=container.cpu,
+                            memory=container.memory,
+                            ports=ports,
+                            inherit_env=container.inherit_env,
+                        )
+                    )
 
             print(
                 f"\n📊 Total container specs in workload {workload_name}: {len(containers)}"
@@ -84,39 +102,37 @@ def list_workload_containers(
 
 
 def demonstrate_container_execution(
-    client: cpln.CPLNClient, gvc_name: str, workload_name: str, location: str
+    workload: Workload,
+    location: str,
+    containers: Optional[list[Container]] = None,
+    out: Optional[TextIO] = None,
 ):
     """
     Demonstrate container execution capabilities.
 
     Args:
-        client: CPLN client instance
-        gvc_name: Name of the GVC
-        workload_name: Name of the workload
+        workload: The workload to execute in
         location: Location to execute in
+        containers: The workload's container specs, if already parsed
+        out: Stream to write to, defaulting to stdout
     """
-    print(f"\n=== Container Execution Demo: {workload_name} ===")
+    print(f"\n=== Container Execution Demo: {workload.attrs['name']} ===", file=out)
 
     try:
-        # Create config and get the workload
-        config = WorkloadConfig(
-            gvc=gvc_name, workload_id=workload_name, location=location
-        )
-        workload = client.workloads.get(config)
-
         # Try to ping the workload
-        print("\n🏓 Pinging workload...")
+        print("\n🏓 Pinging workload...", file=out)
         ping_result = workload.ping(location=location)
 
-        print(f"   Status: {ping_result['status']}")
-        print(f"   Message: {ping_result['message']}")
-        print(f"   Exit Code: {ping_result['exit_code']}")
+        print(f"   Status: {ping_result['status']}", file=out)
+        print(f"   Message: {ping_result['message']}", file=out)
+        print(f"   Exit Code: {ping_result['exit_code']}", file=out)
 
-        # Get available containers
-        containers = workload.get_containers()
+        # Get available containers, unless the caller already has them
+        if containers is None:
+            containers = workload.get_containers()
         if containers:
             container_name = containers[0].name
-            print(f"\n💻 Executing command in container: {container_name}")
+            print(f"\n💻 Executing command in container: {container_name}", file=out)
 
             try:
                 # Execute a simple command
@@ -125,22 +141,27 @@ def demonstrate_container_execution(
                     location=location,
                     container=container_name,
                 )
-                print(f"   Command executed successfully: {result}")
+                print(f"   Command executed successfully: {result}", file=out)
 
             except Exception as e:
-                print(f"   Execution failed: {e}")
+                print(f"   Execution failed: {e}", file=out)
 
     except Exception as e:
-        print(f"Error during execution demo: {e}")
+        print(f"Error during execution demo: {e}", file=out)
 
 
-def list_containers_across_workloads(client: cpln.CPLNClient, gvc_name: str):
+def list_containers_across_workloads(
+    client: cpln.CPLNClient,
+    gvc_name: str,
+    workloads: Optional[list[Workload]] = None,
+):
     """
     List containers across all workloads in a GVC.
 
     Args:
         client: CPLN client instance
         gvc_name: Name of the GVC
+        workloads: The GVC's workloads, if already fetched
 
     Returns:
         Total count of containers found
@@ -148,8 +169,9 @@ def list_containers_across_workloads(client: cpln.CPLNClient, gvc_name: str):
     print("\n=== Container Summary Across All Workloads ===")
 
     try:
-        # Get all workloads in the GVC first
-        workloads = client.workloads.list(gvc=gvc_name)
+        # Get all workloads in the GVC first, unless the caller already has them
+        if workloads is None:
+            workloads = client.workloads.list(gvc=gvc_name)
 
         if not workloads:
             print("No workloads found in this GVC.")
@@ -157,22 +179,27 @@ def list_containers_across_workloads(client: cpln.CPLNClient, gvc_name: str):
 
         print(f"Found {len(workloads)} workload(s) in GVC '{gvc_name}':")
 
+        # Render the whole summary first and write it out in one go
+        rows = []
         total_containers = 0
         for workload in workloads:
+            name = workload.attrs["name"]
             try:
                 # Get containers for each workload
-                containers = workload.get_containers()
-                container_count = len(containers) if containers else 0
-                total_containers += container_count
-
-                print(f"  ├─ {workload.attrs['name']}: {container_count} containers")
-
-                if containers:
-                    for container in containers:
-                        print(f"     └─ {container.name} ({container.image})")
-
+                containers = workload.get_containers() or []
             except Exception as e:
-                print(f"  ├─ {workload.attrs['name']}: Error getting containers - {e}")
+                rows.append(f"  ├─ {name}: Error getting containers - {e}\n")
+                continue
+
+            total_containers += len(containers)
+            rows.append(
+                WORKLOAD_SUMMARY_TEMPLATE.format(name=name, count=len(containers))
+            )
+            rows.extend(
+                CONTAINER_SUMMARY_TEMPLATE.format(name=c.name, image=c.image)
+                for c in containers
+            )
+        sys.stdout.write("".join(rows))
 
         print(f"\n📊 Total containers across all workloads: {total_containers}")
         return total_containers
@@ -186,16 +213,32 @@ def main():
     """
     Main example function.
     """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("gvc", nargs="?", help="GVC containing the workload")
+    parser.add_argument("workload", nargs="?", help="Workload to inspect")
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print each container's spec even when stdout is not a terminal",
+    )
+    args = parser.parse_args()
+    verbose = args.verbose or sys.stdout.isatty()
+
     print("Control Plane Container Operations Example (Workload-Centric)")
     print("=============================================================")
 
     # Check for required environment variables
-    if not os.getenv("CPLN_TOKEN"):
+    token = os.environ.get("CPLN_TOKEN")
+    org = os.environ.get("CPLN_ORG")
+    if not token:
         print("\nError: CPLN_TOKEN environment variable is required.")
         print("Please set it to your Control Plane service account token.")
         return
 
-    if not os.getenv("CPLN_ORG"):
+    if not org:
         print("\nError: CPLN_ORG environment variable is required.")
         print("Please set it to your Control Plane organization name.")
         return
@@ -204,71 +247,72 @@ def main():
     try:
         client = cpln.CPLNClient.from_env()
         print("\nConnected to Control Plane API")
-        print(f"Organization: {os.getenv('CPLN_ORG')}")
-        print(f"Base URL: {os.getenv('CPLN_BASE_URL', 'https://api.cpln.io')}")
+        print(f"Organization: {org}")
+        print(f"Base URL: {client.api.config.base_url}")
     except Exception as e:
         print(f"\nError initializing client: {e}")
         return
 
-    # Example GVC name - you may need to change this
-    gvc_name = "example-gvc"
-    workload_name = "example-workload"
-
-    # Check if the user provided a GVC name as command line argument
-    if len(sys.argv) > 1:
-        gvc_name = sys.argv[1]
-    if len(sys.argv) > 2:
-        workload_name = sys.argv[2]
-    else:
-        print(f"\nUsing default GVC name: {gvc_name}")
-        print(f"Using default workload name: {workload_name}")
-        print(f"Usage: python {sys.argv[0]} <gvc-name> <workload-name>")
-
-    # Example 1: List containers for a specific workload (preferred workload-centric approach)
-    print("\n1. Workload-centric container access (recommended):")
-    containers = list_workload_containers(client, gvc_name, workload_name)
-
-    if not containers:
-        print(f"\n❌ Could not access workload '{workload_name}' in GVC '{gvc_name}'")
-        print("Please check that the GVC and workload exist and you have access.")
-        return
-
-    # Example 2: Overview of all containers in the GVC
-    print(f"\n2. Overview of all containers in GVC '{gvc_name}':")
     try:
-        workloads = client.workloads.list(gvc=gvc_name)
-        total_containers = 0
+        # Example GVC name - you may need to change this
+        gvc_name = args.gvc or "example-gvc"
+        workload_name = args.workload or "example-workload"
+
+        # Check if the user provided a GVC name as command line argument
+        if args.workload is None:
+            print(f"\nUsing default GVC name: {gvc_name}")
+            print(f"Using default workload name: {workload_name}")
+            print(f"Usage: python {sys.argv[0]} <gvc-name> <workload-name>")
+
+        # Fetch the GVC's workloads once; both examples below work from this list
+        try:
+            workloads = client.workloads.list(gvc=gvc_name)
+        except Exception as e:
+            print(f"Error listing workloads: {e}")
+            return
+
+        # Example 1: List containers for a specific workload (preferred workload-centric approach)
+        print("\n1. Workload-centric container access (recommended):")
+        workload = next(
+            (w for w in workloads if w.attrs["name"] == workload_name), None
+        )
+        containers = list_workload_containers(workload, verbose) if workload else []
 
-        for workload in workloads:
-            try:
-                workload_containers = workload.get_containers()
-                container_count = len(workload_containers) if workload_containers else 0
-                total_containers += container_count
-                print(f"  ├─ {workload.attrs['name']}: {container_count} containers")
-            except Exception as e:
-                print(f"  ├─ {workload.attrs['name']}: Error getting containers - {e}")
+        if not containers:
+            print(
+                f"\n❌ Could not access workload '{workload_name}' in GVC '{gvc_name}'"
+            )
+            print("Please check that the GVC and workload exist and you have access.")
+            return
 
-        print(f"\n📊 Total containers across all workloads: {total_containers}")
-    except Exception as e:
-        print(f"Error listing workloads: {e}")
+        # Example 2: Overview of all containers in the GVC
+        print(f"\n2. Overview of all containers in GVC '{gvc_name}':")
+        list_containers_across_workloads(client, gvc_name, workloads=workloads)
 
-    print("\n=== Workload-Centric Design Principles ===")
-    print("✅ Always access containers through their parent workload")
-    print("✅ Use workload.get_container_objects() for workload-specific containers")
-    print("✅ Use ContainerCollection.list(gvc, workload_name) for specific workloads")
-    print("✅ Iterate through workloads individually for multi-workload access")
-    print("❌ Avoid cross-workload container listing without workload context")
-
-    print("\n=== Container API Limitations ===")
-    print("Note: Container operations are read-only in the Control Plane API.")
-    print("Containers are managed through workload deployments, not directly.")
-    print("Available operations:")
-    print("  ✅ List containers (workload-centric)")
-    print("  ✅ View container status and health")
-    print("  ✅ Inspect container configuration")
-    print("  ❌ Start/stop containers")
-    print("  ❌ Execute commands in containers (use workload.exec() instead)")
-    print("  ❌ Access container logs directly")
+        print("\n=== Workload-Centric Design Principles ===")
+        print("✅ Always access containers through their parent workload")
+        print(
+            "✅ Use workload.get_container_objects() for workload-specific containers"
+        )
+        print(
+            "✅ Use ContainerCollection.list(gvc, workload_name) for specific workloads"
+        )
+        print("✅ Iterate through workloads individually for multi-workload access")
+        print("❌ Avoid cross-workload container listing without workload context")
+
+        print("\n=== Container API Limitations ===")
+        print("Note: Container operations are read-only in the Control Plane API.")
+        print("Containers are managed through workload deployments, not directly.")
+        print("Available operations:")
+        print("  ✅ List containers (workload-centric)")
+        print("  ✅ View container status and health")
+        print("  ✅ Inspect container configuration")
+        print("  ❌ Start/stop containers")
+        print("  ❌ Execute commands in containers (use workload.exec() instead)")
+        print("  ❌ Access container logs directly")
+    finally:
+        # Release the client's pooled connections
+        client.close()
 
 
 if __name__ == "__main__":
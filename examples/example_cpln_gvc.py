@@ -9,7 +9,6 @@ from typing import List
 import cpln
 from cpln.exceptions import CPLNError
 from cpln.models.gvcs import GVC
-from utils import safe_get_attr
 
 
 def get_cpln_client() -> cpln.CPLNClient:
@@ -23,12 +22,7 @@ def get_cpln_client() -> cpln.CPLNClient:
         cpln.exceptions.CPLNError: If client initialization fails
     """
     try:
-        client = cpln.CPLNClient.from_env()
-        client = cpln.CPLNClient(
-            token=client.api.config.token,
-            org=client.api.config.org,
-        )
-        return client
+        return cpln.CPLNClient.from_env()
     except CPLNError as e:
         print(f"Failed to initialize CPLN client: {e}", file=sys.stderr)
         raise
@@ -77,6 +71,7 @@ def get_gvc_details(client: cpln.CPLNClient, gvc_name: str) -> GVC:
 
 def main() -> None:
     """Main function to demonstrate GVC operations."""
+    client = None
     try:
         # Initialize client
         client = get_cpln_client()
@@ -89,20 +84,23 @@ def main() -> None:
         for gvc in gvcs:
             print(f"\nGVC: {gvc.name}")
 
-            # Get detailed information for each GVC
-            details = get_gvc_details(client, gvc.name)
+            # The list response already carries each GVC in full; only fetch
+            # the details separately if the spec is missing
+            details = gvc if "spec" in gvc.attrs else get_gvc_details(client, gvc.name)
 
             # Print basic information that should always be available
-            print(f"Name: {safe_get_attr(details, 'name')}")
-            print(f"Description: {safe_get_attr(details, 'description')}")
+            attrs = details.attrs
+            print(f"Name: {attrs.get('name', 'N/A')}")
+            print(f"Description: {attrs.get('description', 'N/A')}")
 
             # Print optional information if available
-            if hasattr(details, "status"):
-                print(f"Status: {details.status}")
+            status = attrs.get("status")
+            if status is not None:
+                print(f"Status: {status}")
 
             # Print spec information if available
-            if hasattr(details, "spec"):
-                spec = details.spec
+            spec = attrs.get("spec")
+            if spec is not None:
                 print(f"Spec: {spec}")
 
     except CPLNError as e:
@@ -111,6 +109,10 @@ def main() -> None:
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Release the client's pooled connections
+        if client is not None:
+            client.close()
 
 
 if __name__ == "__main__":
@@ -3,14 +3,37 @@
 Example script demonstrating how to work with Images using the CPLN Python client.
 """
 
+import argparse
 import sys
+from itertools import islice
 from typing import List
 
 import cpln
 from cpln.exceptions import CPLNError
 from cpln.models.gvcs import GVC
 from cpln.models.images import Image
-from utils import safe_get_attr
+
+
+def non_negative_int(value: str) -> int:
+    """
+    Parse a command line argument as an integer that is zero or more.
+
+    Args:
+        value: The argument as given on the command line
+
+    Returns:
+        int: The parsed value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a non-negative integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {number}")
+    return number
 
 
 def get_cpln_client() -> cpln.CPLNClient:
@@ -24,12 +47,7 @@ def get_cpln_client() -> cpln.CPLNClient:
         cpln.exceptions.CPLNError: If client initialization fails
     """
     try:
-        client = cpln.CPLNClient.from_env()
-        client = cpln.CPLNClient(
-            token=client.api.config.token,
-            org=client.api.config.org,
-        )
-        return client
+        return cpln.CPLNClient.from_env()
     except CPLNError as e:
         print(f"Failed to initialize CPLN client: {e}", file=sys.stderr)
         raise
@@ -113,18 +131,27 @@ def filter_images_by_repository(images: List[Image], repository: str) -> List[Im
 
 def main() -> None:
     """Main function to demonstrate image operations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("gvc", nargs="?", help="GVC to use")
+    parser.add_argument(
+        "--limit",
+        type=non_negative_int,
+        default=None,
+        help="Only show the first LIMIT images",
+    )
+    args = parser.parse_args()
+
+    client = None
     try:
         # Initialize client
         client = get_cpln_client()
         print("CPLN Client initialized successfully")
 
         # Get GVC first
-        gvc_name = "example-gvc"  # You might want to make this configurable
+        gvc_name = args.gvc or "example-gvc"
 
         # Check if the user provided a GVC name as command line argument
-        if len(sys.argv) > 1:
-            gvc_name = sys.argv[1]
-        else:
+        if args.gvc is None:
             print(f"\nUsing default GVC name: {gvc_name}")
             print(f"You can specify a different GVC: python {sys.argv[0]} <gvc-name>")
 
@@ -134,24 +161,33 @@ def main() -> None:
         # List all images
         images = list_images(client)
         print(f"\nFound {len(images)} images in the organization:")
+        if args.limit is not None and args.limit < len(images):
+            print(f"Showing the first {args.limit}")
 
-        for image in images:
+        for image in islice(images, args.limit):
             print(f"\nImage: {image.name}")
             print(f"Repository: {image.repository}")
             print(f"Tag: {image.tag}")
 
-            # Get detailed information for each image
-            details = get_image_details(client, image.name)
-
-            print(f"Digest: {safe_get_attr(details, 'digest')}")
-            print(f"Created: {safe_get_attr(details, 'created')}")
-            print(f"Last Modified: {safe_get_attr(details, 'last_modified')}")
+            # The list response already carries each image in full; only fetch
+            # the details separately if they are missing
+            details = (
+                image
+                if "digest" in image.attrs
+                else get_image_details(client, image.name)
+            )
+
+            attrs = details.attrs
+            print(f"Digest: {attrs.get('digest', 'N/A')}")
+            print(f"Created: {attrs.get('created', 'N/A')}")
+            print(f"Last Modified: {attrs.get('lastModified', 'N/A')}")
             # print(f"Size: {details.size_bytes} bytes")
 
             # Print additional metadata if available
-            if hasattr(details, "metadata"):
+            metadata = attrs.get("metadata")
+            if metadata is not None:
                 print("Metadata:")
-                for key, value in details.metadata.items():
+                for key, value in metadata.items():
                     print(f"  {key}: {value}")
 
     except CPLNError as e:
@@ -160,6 +196,10 @@ def main() -> None:
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Release the client's pooled connections
+        if client is not None:
+            client.close()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@
 Example script demonstrating how to list and inspect workloads using the CPLN Python client.
 """
 
+import argparse
+import json
 import sys
 
 import cpln
@@ -21,15 +23,7 @@ def get_cpln_client() -> cpln.CPLNClient:
         cpln.exceptions.CPLNError: If client initialization fails
     """
     try:
-        # First create client from environment variables
-        client = cpln.CPLNClient.from_env()
-
-        # Then create a new client with explicit configuration
-        client = cpln.CPLNClient(
-            token=client.api.config.token,
-            org=client.api.config.org,
-        )
-        return client
+        return cpln.CPLNClient.from_env()
     except CPLNError as e:
         print(f"Failed to initialize CPLN client: {e}", file=sys.stderr)
         raise
@@ -56,20 +50,91 @@ def list_workloads(client: cpln.CPLNClient, gvc: str) -> list[Workload]:
         raise
 
 
+def describe_workload(workload: Workload) -> str:
+    """
+    Render the spec, containers and status of a workload as text.
+
+    The whole block is built up front so it can be written in one call.
+
+    Args:
+        workload: The workload to describe
+
+    Returns:
+        str: The newline-terminated description
+    """
+    lines = [f"\nWorkload: {workload.name}"]
+
+    # Get workload spec and containers using the proper API
+    try:
+        spec = workload.get_spec()
+        lines.append(f"Type: {spec.type}")
+
+        containers = workload.get_containers()
+        lines.append(f"Containers: {len(containers)}")
+
+        for i, container in enumerate(containers):
+            lines.append(f"  Container {i + 1}: {container.name}")
+            lines.append(f"    Image: {container.image}")
+            lines.append(f"    CPU: {container.cpu}")
+            lines.append(f"    Memory: {container.memory}")
+            if container.ports:
+                lines.append(f"    Ports: {len(container.ports)}")
+                for port in container.ports:
+                    lines.append(f"      {port.number}/{port.protocol}")
+            lines.append(f"    Inherit Env: {container.inherit_env}")
+
+    except Exception as e:
+        lines.append(f"Error getting spec/containers: {e}")
+        # Fallback to raw data if parsing fails
+        if "spec" in workload.attrs:
+            spec_data = workload.attrs["spec"]
+            lines.append(f"Type: {spec_data.get('type', 'Unknown')}")
+            if "containers" in spec_data:
+                lines.append(f"Containers: {len(spec_data['containers'])} (raw data)")
+
+    # Try to get status information if available in attrs
+    if "status" in workload.attrs:
+        status = workload.attrs["status"]
+        if isinstance(status, dict):
+            lines.append(f"Status: {status.get('phase', 'Unknown')}")
+        else:
+            lines.append(f"Status: {status}")
+    else:
+        lines.append("Status: Not available (use deployment status for live status)")
+
+    return "\n".join(lines) + "\n"
+
+
 def main() -> None:
     """Main function to demonstrate workload operations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("gvc", nargs="?", help="GVC to list workloads from")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Write the raw workloads as JSON instead of a formatted summary",
+    )
+    args = parser.parse_args()
+
+    client = None
     try:
         # Initialize client
         client = get_cpln_client()
-        print("CPLN Client initialized successfully")
 
         # List workloads
-        gvc_name = "david"  # You might want to make this configurable
+        gvc_name = args.gvc or "david"  # You might want to make this configurable
+
+        if args.json:
+            # Machine-readable output skips the human formatting entirely
+            workloads = list_workloads(client, gvc_name)
+            json.dump([workload.attrs for workload in workloads], sys.stdout)
+            sys.stdout.write("\n")
+            return
+
+        print("CPLN Client initialized successfully")
 
         # Check if the user provided a GVC name as command line argument
-        if len(sys.argv) > 1:
-            gvc_name = sys.argv[1]
-        else:
+        if args.gvc is None:
             print(f"\nUsing default GVC name: {gvc_name}")
             print(f"You can specify a different GVC: python {sys.argv[0]} <gvc-name>")
 
@@ -78,45 +143,7 @@ def main() -> None:
         # Print workload information
         print(f"\nFound {len(workloads)} workloads in GVC '{gvc_name}':")
         for workload in workloads:
-            print(f"\nWorkload: {workload.name}")
-
-            # Get workload spec and containers using the proper API
-            try:
-                spec = workload.get_spec()
-                print(f"Type: {spec.type}")
-
-                containers = workload.get_containers()
-                print(f"Containers: {len(containers)}")
-
-                for i, container in enumerate(containers):
-                    print(f"  Container {i+1}: {container.name}")
-                    print(f"    Image: {container.image}")
-                    print(f"    CPU: {container.cpu}")
-                    print(f"    Memory: {container.memory}")
-                    if container.ports:
-                        print(f"    Ports: {len(container.ports)}")
-                        for port in container.ports:
-                            print(f"      {port.number}/{port.protocol}")
-                    print(f"    Inherit Env: {container.inherit_env}")
-
-            except Exception as e:
-                print(f"Error getting spec/containers: {e}")
-                # Fallback to raw data if parsing fails
-                if "spec" in workload.attrs:
-                    spec_data = workload.attrs["spec"]
-                    print(f"Type: {spec_data.get('type', 'Unknown')}")
-                    if "containers" in spec_data:
-                        print(f"Containers: {len(spec_data['containers'])} (raw data)")
-
-            # Try to get status information if available in attrs
-            if "status" in workload.attrs:
-                status = workload.attrs["status"]
-                if isinstance(status, dict):
-                    print(f"Status: {status.get('phase', 'Unknown')}")
-                else:
-                    print(f"Status: {status}")
-            else:
-                print("Status: Not available (use deployment status for live status)")
+            sys.stdout.write(describe_workload(workload))
 
     except CPLNError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -124,6 +151,10 @@ def main() -> None:
     except KeyboardInterrupt:
         print("\nOperation cancelled by user", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Release the client's pooled connections
+        if client is not None:
+            client.close()
 
 
 if __name__ == "__main__":
@@ -12,22 +12,71 @@ Key features:
 - Container execution commands
 
 Usage:
-    python examples/example_modern_workload_containers.py [gvc-name] [workload-name]
+    python examples/example_modern_workload_containers.py [--json] [--max-items N] [gvc-name] [workload-name] [location]
 """
 
+import argparse
+import io
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Optional, TextIO
 
-# Add the src directory to the path to import cpln
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from example_cpln_containers import (
+    CONTAINER_SPEC_TEMPLATE,
+    PORT_TEMPLATE,
+    demonstrate_container_execution,
+)
 
-# ruff: noqa: E402
 import cpln
 from cpln.config import WorkloadConfig
+from cpln.models.workloads import Workload
+
+# Number of live containers, and of replicas per container, listed by default
+DEFAULT_MAX_ITEMS = 25
+
+# Report lines for one live container and its replica utilization
+LIVE_CONTAINER_TEMPLATE = (
+    "  ├─ {name}\n"
+    "  │  Image: {image}\n"
+    "  │  Ready: {ready_icon} {ready}\n"
+    "  │  Healthy: {healthy_icon} {healthy}"
+)
+UTILIZATION_TEMPLATE = (
+    "  │  Replica Utilization: {utilization:.1f}%\n"
+    "  │  Replicas: {replicas_ready}/{replicas}"
+)
+
+
+def non_negative_int(value: str) -> int:
+    """
+    Parse a command line argument as an integer that is zero or more.
+
+    Args:
+        value: The argument as given on the command line
+
+    Returns:
+        The parsed value
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a non-negative integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {number}")
+    return number
 
 
 def inspect_workload_containers(
-    client: cpln.CPLNClient, gvc_name: str, workload_name: str
+    client: cpln.CPLNClient,
+    gvc_name: str,
+    workload_name: str,
+    out: Optional[TextIO] = None,
 ):
     """
     Inspect container specifications for a specific workload.
@@ -36,8 +85,10 @@ def inspect_workload_containers(
         client: CPLN client instance
         gvc_name: Name of the GVC
         workload_name: Name of the specific workload
+        out: Stream to write to, defaulting to stdout
     """
-    print(f"\n=== Workload Container Specifications: {workload_name} ===")
+    # Collect the report and write it out in one go
+    lines = [f"\n=== Workload Container Specifications: {workload_name} ==="]
 
     try:
         # Create config and get the workload
@@ -48,238 +99,334 @@ def inspect_workload_containers(
         containers = workload.get_containers()
 
         if containers:
-            print(
+            lines.append(
                 f"\n📦 Workload: {workload.attrs['name']} ({len(containers)} container specs)"
             )
 
             for container in containers:
-                print(f"  ├─ Container: {container.name}")
-                print(f"  │  Image: {container.image}")
-                print(f"  │  CPU: {container.cpu}")
-                print(f"  │  Memory: {container.memory}")
-
                 # Show ports if any
+                ports = ""
                 if container.ports:
-                    print(f"  │  Ports: {len(container.ports)}")
-                    for port in container.ports:
-                        print(f"  │    {port.number}/{port.protocol}")
+                    ports = f"  │  Ports: {len(container.ports)}\n" + "".join(
+                        PORT_TEMPLATE.format(number=port.number, protocol=port.protocol)
+                        for port in container.ports
+                    )
 
-                print(f"  │  Inherit Env: {container.inherit_env}")
-                print("  │")
+                lines.append(
+                    CONTAINER_SPEC_TEMPLATE.format(
+                        name=container.name,
+                        image=container.image,
+                        cpu=container.cpu,
+                        memory=container.memory,
+                        ports=ports,
+                        inherit_env=container.inherit_env,
+                    ).rstrip("\n")
+                )
 
-            print(f"\n📊 Total container specs: {len(containers)}")
+            lines.append(f"\n📊 Total container specs: {len(containers)}")
         else:
-            print(f"No container specs found in workload {workload_name}.")
+            lines.append(f"No container specs found in workload {workload_name}.")
 
         return workload, containers
 
     except Exception as e:
-        print(f"Error inspecting workload {workload_name}: {e}")
+        lines.append(f"Error inspecting workload {workload_name}: {e}")
         return None, []
 
+    finally:
+        (out or sys.stdout).write("\n".join(lines) + "\n")
+
 
 def inspect_deployment_status(
-    client: cpln.CPLNClient, gvc_name: str, workload_name: str, location: str
+    workload: Workload,
+    location: str,
+    out: Optional[TextIO] = None,
+    max_items: int = DEFAULT_MAX_ITEMS,
 ):
     """
     Inspect live deployment status and containers.
 
     Args:
-        client: CPLN client instance
-        gvc_name: Name of the GVC
-        workload_name: Name of the workload
+        workload: The workload to inspect
         location: Location to inspect
+        out: Stream to write to, defaulting to stdout
+        max_items: Maximum number of live containers, and of replicas per
+            container, to list
     """
-    print(f"\n=== Live Deployment Status: {workload_name} @ {location} ===")
+    # Collect the report and write it out in one go
+    lines = [f"\n=== Live Deployment Status: {workload.attrs['name']} @ {location} ==="]
 
     try:
-        # Create config and get the workload
-        config = WorkloadConfig(
-            gvc=gvc_name, workload_id=workload_name, location=location
-        )
-        workload = client.workloads.get(config)
-
         # Get deployment information
         deployment = workload.get_deployment(location=location)
 
-        print(f"\n🚀 Deployment: {deployment.name}")
-        print(f"   Kind: {deployment.kind}")
-        print(f"   Last Modified: {deployment.last_modified}")
+        lines.append(f"\n🚀 Deployment: {deployment.name}")
+        lines.append(f"   Kind: {deployment.kind}")
+        lines.append(f"   Last Modified: {deployment.last_modified}")
 
         # Get deployment status
         status = deployment.status
-        print(f"   Ready: {'✅' if status.ready else '❌'} {status.ready}")
-        print(f"   Message: {status.message}")
+        ready = status.ready
+        lines.append(f"   Ready: {'✅' if ready else '❌'} {ready}")
+        lines.append(f"   Message: {status.message}")
 
-        if hasattr(status, "endpoint") and status.endpoint:
-            print(f"   Endpoint: {status.endpoint}")
+        endpoint = status.endpoint
+        if endpoint:
+            lines.append(f"   Endpoint: {endpoint}")
 
-        if hasattr(status, "remote") and status.remote:
-            print(f"   Remote: {status.remote}")
+        remote = status.remote
+        if remote:
+            lines.append(f"   Remote: {remote}")
 
         # Get live container information
         containers = deployment.get_containers()
         if containers:
-            print(f"\n📦 Live Containers ({len(containers)}):")
-            for name, container in containers.items():
-                print(f"  ├─ {name}")
-                print(f"  │  Image: {container.image}")
-                print(
-                    f"  │  Ready: {'✅' if container.ready else '❌'} {container.ready}"
-                )
-                print(
-                    f"  │  Healthy: {'✅' if container.is_healthy() else '❌'} {container.is_healthy()}"
+            lines.append(f"\n📦 Live Containers ({len(containers)}):")
+            for name, container in islice(containers.items(), max_items):
+                ready = container.ready
+                healthy = container.is_healthy()
+                lines.append(
+                    LIVE_CONTAINER_TEMPLATE.format(
+                        name=name,
+                        image=container.image,
+                        ready_icon="✅" if ready else "❌",
+                        ready=ready,
+                        healthy_icon="✅" if healthy else "❌",
+                        healthy=healthy,
+                    )
                 )
 
                 # Show resource utilization
-                utilization = container.get_resource_utilization()
-                if utilization["replica_utilization"] is not None:
-                    print(
-                        f"  │  Replica Utilization: {utilization['replica_utilization']:.1f}%"
-                    )
-                    print(
-                        f"  │  Replicas: {container.resources.replicas_ready}/{container.resources.replicas}"
+                replica_utilization = container.get_resource_utilization()[
+                    "replica_utilization"
+                ]
+                if replica_utilization is not None:
+                    resources = container.resources
+                    lines.append(
+                        UTILIZATION_TEMPLATE.format(
+                            utilization=replica_utilization,
+                            replicas_ready=resources.replicas_ready,
+                            replicas=resources.replicas,
+                        )
                     )
 
-                if hasattr(container, "message"):
-                    print(f"  │  Message: {container.message}")
-                print("  │")
+                lines.append(f"  │  Message: {container.message}")
+                lines.append("  │")
+            if len(containers) > max_items:
+                lines.append(f"  … and {len(containers) - max_items} more")
 
         # Get replicas
         replicas = deployment.get_replicas()
         if replicas:
-            print("\n🔄 Replicas:")
+            lines.append("\n🔄 Replicas:")
             for container_name, replica_list in replicas.items():
-                print(f"  Container: {container_name} ({len(replica_list)} replicas)")
-                for replica in replica_list:
-                    print(f"    ├─ {replica.name}")
+                lines.append(
+                    f"  Container: {container_name} ({len(replica_list)} replicas)"
+                )
+                for replica in replica_list[:max_items]:
+                    lines.append(f"    ├─ {replica.name}")
+                if len(replica_list) > max_items:
+                    lines.append(f"    … and {len(replica_list) - max_items} more")
 
         return deployment
 
     except Exception as e:
-        print(f"Error inspecting deployment: {e}")
+        lines.append(f"Error inspecting deployment: {e}")
         return None
 
+    finally:
+        (out or sys.stdout).write("\n".join(lines) + "\n")
 
-def demonstrate_container_execution(
+
+def write_json_report(
     client: cpln.CPLNClient, gvc_name: str, workload_name: str, location: str
-):
+) -> None:
     """
-    Demonstrate container execution capabilities.
+    Write the workload's container specs and live deployment as one JSON
+    document, for consumption by other tools.
 
     Args:
         client: CPLN client instance
         gvc_name: Name of the GVC
-        workload_name: Name of the workload
-        location: Location to execute in
+        workload_name: Name of the specific workload
+        location: Location to inspect
     """
-    print(f"\n=== Container Execution Demo: {workload_name} ===")
-
-    try:
-        # Create config and get the workload
-        config = WorkloadConfig(
-            gvc=gvc_name, workload_id=workload_name, location=location
-        )
-        workload = client.workloads.get(config)
-
-        # Try to ping the workload
-        print("\n🏓 Pinging workload...")
-        ping_result = workload.ping(location=location)
-
-        print(f"   Status: {ping_result['status']}")
-        print(f"   Message: {ping_result['message']}")
-        print(f"   Exit Code: {ping_result['exit_code']}")
-
-        # Get available containers
-        containers = workload.get_containers()
-        if containers:
-            container_name = containers[0].name
-            print(f"\n💻 Executing command in container: {container_name}")
-
-            try:
-                # Execute a simple command
-                result = workload.exec(
-                    "echo 'Hello from container!'",
-                    location=location,
-                    container=container_name,
-                )
-                print(f"   Command executed successfully: {result}")
-
-            except Exception as e:
-                print(f"   Execution failed: {e}")
-
-    except Exception as e:
-        print(f"Error during execution demo: {e}")
+    config = WorkloadConfig(gvc=gvc_name, workload_id=workload_name)
+    handle = client.workloads.prepare_model(
+        {"name": workload_name}, state={"gvc": gvc_name}
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        workload_future = executor.submit(client.workloads.get, config)
+        deployment_future = executor.submit(handle.get_deployment, location)
+
+        workload = workload_future.result()
+        try:
+            deployment = deployment_future.result().export()
+        except Exception:
+            # The workload may simply not be deployed at this location
+            deployment = None
+
+    report = {
+        "workload": workload.attrs["name"],
+        "gvc": gvc_name,
+        "location": location,
+        "containers": [container.to_dict() for container in workload.get_containers()],
+        "deployment": deployment,
+    }
+    sys.stdout.write(json.dumps(report) + "\n")
 
 
 def main():
     """
     Main example function.
     """
-    print("Modern Control Plane Container Operations Example")
-    print("==============================================")
-
-    # Check for required environment variables
-    if not os.getenv("CPLN_TOKEN"):
-        print("\nError: CPLN_TOKEN environment variable is required.")
-        print("Please set it to your Control Plane service account token.")
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("gvc", nargs="?", help="GVC containing the workload")
+    parser.add_argument("workload", nargs="?", help="Workload to inspect")
+    parser.add_argument("location", nargs="?", help="Location to inspect")
+    parser.add_argument(
+        "--max-items",
+        type=non_negative_int,
+        default=DEFAULT_MAX_ITEMS,
+        help="Maximum number of live containers, and of replicas per container, "
+        f"to list (default: {DEFAULT_MAX_ITEMS})",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Write the container specs and deployment as JSON instead of a "
+        "formatted report",
+    )
+    args = parser.parse_args()
+    as_json = args.json
+
+    if not as_json:
+        print("Modern Control Plane Container Operations Example")
+        print("==============================================")
+
+    # Check for required environment variables; errors go to stderr so that
+    # stdout only ever carries the report
+    token = os.environ.get("CPLN_TOKEN")
+    org = os.environ.get("CPLN_ORG")
+    if not token:
+        print("\nError: CPLN_TOKEN environment variable is required.", file=sys.stderr)
+        print(
+            "Please set it to your Control Plane service account token.",
+            file=sys.stderr,
+        )
         return
 
-    if not os.getenv("CPLN_ORG"):
-        print("\nError: CPLN_ORG environment variable is required.")
-        print("Please set it to your Control Plane organization name.")
+    if not org:
+        print("\nError: CPLN_ORG environment variable is required.", file=sys.stderr)
+        print("Please set it to your Control Plane organization name.", file=sys.stderr)
         return
 
     # Initialize client from environment variables
     try:
         client = cpln.CPLNClient.from_env()
-        print("\n✅ Connected to Control Plane API")
-        print(f"   Organization: {os.getenv('CPLN_ORG')}")
-        print(f"   Base URL: {os.getenv('CPLN_BASE_URL', 'https://api.cpln.io')}")
     except Exception as e:
-        print(f"\nError initializing client: {e}")
+        print(f"\nError initializing client: {e}", file=sys.stderr)
         return
 
-    # Get parameters from command line or use defaults
-    gvc_name = sys.argv[1] if len(sys.argv) > 1 else "example-gvc"
-    workload_name = sys.argv[2] if len(sys.argv) > 2 else "example-workload"
-    location = sys.argv[3] if len(sys.argv) > 3 else "aws-us-east-1"
+    try:
+        # Get parameters from command line or use defaults
+        gvc_name = args.gvc or "example-gvc"
+        workload_name = args.workload or "example-workload"
+        location = args.location or "aws-us-east-1"
 
-    if len(sys.argv) <= 1:
-        print("\nUsing defaults:")
-        print(f"  GVC: {gvc_name}")
-        print(f"  Workload: {workload_name}")
-        print(f"  Location: {location}")
-        print(f"\nUsage: python {sys.argv[0]} <gvc-name> <workload-name> [location]")
+        if as_json:
+            # Machine-readable output skips the human formatting entirely
+            try:
+                write_json_report(client, gvc_name, workload_name, location)
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
+                sys.exit(1)
+            return
 
-    # 1. Inspect workload container specifications
-    workload, containers = inspect_workload_containers(client, gvc_name, workload_name)
+        print("\n✅ Connected to Control Plane API")
+        print(f"   Organization: {org}")
+        print(f"   Base URL: {client.api.config.base_url}")
+
+        if args.gvc is None:
+            print("\nUsing defaults:")
+            print(f"  GVC: {gvc_name}")
+            print(f"  Workload: {workload_name}")
+            print(f"  Location: {location}")
+            print(
+                f"\nUsage: python {sys.argv[0]} <gvc-name> <workload-name> [location]"
+            )
 
-    if not workload:
-        print(f"\n❌ Could not access workload '{workload_name}' in GVC '{gvc_name}'")
-        print("Please check that the GVC and workload exist and you have access.")
-        return
+        # The deployment endpoint only needs the GVC and workload name, so the
+        # deployment can be fetched alongside the workload itself instead of
+        # waiting for it. Each phase writes to its own buffer, which is flushed
+        # in order below so the reports don't interleave.
+        handle = client.workloads.prepare_model(
+            {"name": workload_name}, state={"gvc": gvc_name}
+        )
+        specs_out = io.StringIO()
+        deployment_out = io.StringIO()
+        execution_out = io.StringIO()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            specs_future = executor.submit(
+                inspect_workload_containers, client, gvc_name, workload_name, specs_out
+            )
+            deployment_future = executor.submit(
+                inspect_deployment_status,
+                handle,
+                location,
+                deployment_out,
+                args.max_items,
+            )
+
+            # 1. Inspect workload container specifications
+            workload, containers = specs_future.result()
+            sys.stdout.write(specs_out.getvalue())
+
+            if not workload:
+                print(
+                    f"\n❌ Could not access workload '{workload_name}' in GVC '{gvc_name}'"
+                )
+                print(
+                    "Please check that the GVC and workload exist and you have access."
+                )
+                return
+
+            # 3. Container execution only needs the workload, so it runs while the
+            # deployment is still being inspected; it reports its own failures
+            # if nothing is deployed at this location
+            execution_future = executor.submit(
+                demonstrate_container_execution,
+                workload,
+                location,
+                containers,
+                execution_out,
+            )
 
-    # 2. Inspect live deployment status
-    deployment = inspect_deployment_status(client, gvc_name, workload_name, location)
-
-    # 3. Demonstrate container execution (if deployment is available)
-    if deployment:
-        demonstrate_container_execution(client, gvc_name, workload_name, location)
-
-    # 4. Summary
-    print("\n=== Summary ===")
-    print(f"✅ Workload specifications: {len(containers)} containers")
-    print(f"✅ Deployment status: {'Available' if deployment else 'Not available'}")
-    print("✅ Modern parser-based API successfully demonstrated")
-
-    print("\n=== Key API Changes ===")
-    print("✅ workload.get_containers() - Get container specifications")
-    print("✅ workload.get_deployment(location) - Get live deployment")
-    print("✅ deployment.get_containers() - Get live container status")
-    print("✅ deployment.get_replicas() - Get replica information")
-    print("✅ workload.exec() - Execute commands in containers")
-    print("✅ workload.ping() - Ping containers")
+            # 2. Inspect live deployment status
+            deployment = deployment_future.result()
+            sys.stdout.write(deployment_out.getvalue())
+
+            execution_future.result()
+            sys.stdout.write(execution_out.getvalue())
+
+        # 4. Summary
+        print("\n=== Summary ===")
+        print(f"✅ Workload specifications: {len(containers)} containers")
+        print(f"✅ Deployment status: {'Available' if deployment else 'Not available'}")
+        print("✅ Modern parser-based API successfully demonstrated")
+
+        print("\n=== Key API Changes ===")
+        print("✅ workload.get_containers() - Get container specifications")
+        print("✅ workload.get_deployment(location) - Get live deployment")
+        print("✅ deployment.get_containers() - Get live container status")
+        print("✅ deployment.get_replicas() - Get replica information")
+        print("✅ workload.exec() - Execute commands in containers")
+        print("✅ workload.ping() - Ping containers")
+    finally:
+        # Release the client's pooled connections
+        client.close()
 
 
 if __name__ == "__main__":
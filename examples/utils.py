@@ -1,5 +1,31 @@
+from functools import lru_cache
+
 from inflection import camelize, titleize, underscore
 
+# Default for getattr that no attribute value can be
+_MISS = object()
+
+
+@lru_cache(maxsize=4096)
+def _formats(attr: str) -> tuple[str, ...]:
+    """
+    Return the distinct case formats of ``attr`` in lookup order.
+
+    Attribute names come from a small, fixed set, so the inflection work is
+    done once per name. Formats that collapse to the same string are only
+    listed once.
+    """
+    return tuple(
+        dict.fromkeys(
+            (
+                attr,  # Original
+                camelize(attr, False),  # camelCase
+                underscore(attr),  # snake_case
+                titleize(attr).replace(" ", ""),  # TitleCase
+            )
+        )
+    )
+
 
 def safe_get_attr(obj: object, attr: str, default: str = "N/A") -> str:
     """
@@ -32,20 +58,15 @@ def safe_get_attr(obj: object, attr: str, default: str = "N/A") -> str:
         >>> safe_get_attr(t, "title_case")  # Will find TitleCase
         'title'
     """
-    # Try different case formats
-    formats = [
-        attr,  # Original
-        camelize(attr, False),  # camelCase
-        underscore(attr),  # snake_case
-        titleize(attr).replace(" ", ""),  # TitleCase
-    ]
-
-    # Try each format
-    for fmt in formats:
-        try:
-            value = getattr(obj, fmt)
+    # Most callers already pass the right name, so try it before inflecting
+    value = getattr(obj, attr, _MISS)
+    if value is not _MISS:
+        return str(value)
+
+    # Try the other formats
+    for fmt in _formats(attr)[1:]:
+        value = getattr(obj, fmt, _MISS)
+        if value is not _MISS:
             return str(value)
-        except AttributeError:
-            continue
 
     return default
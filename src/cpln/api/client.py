@@ -1,11 +1,24 @@
+from functools import cached_property
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from ..constants import (
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_RETRY_JITTER,
+    RETRY_STATUS_CODES,
+)
 from ..errors import APIError, NotFound
 from .config import APIConfig
 from .gvc import GVCApiMixin
 from .image import ImageApiMixin
+from .retry import DeadlineRetry
 from .workload import (
     WorkloadApiMixin,
     WorkloadDeploymentMixin,
@@ -34,7 +47,13 @@ class APIClient(
         base_url (str): URL to the Control Plane server.
         version (str): The version of the API to use. Set to ``auto`` to
             automatically detect the server's version. Default: ``1.0.0``
-        timeout (int): Default timeout for API calls, in seconds.
+        timeout (int): Default timeout for API calls, in seconds. Also bounds
+            the total time spent retrying a request.
+        max_retries (int): Number of retries for rate limited or transiently
+            failing idempotent requests. Default: ``3``
+        max_pool_size (int): The maximum number of connections to the server
+            kept open for reuse, e.g. by callers issuing requests from several
+            threads. Default: ``10``
     """
 
     def __init__(self, config: Optional[APIConfig] = None, **kwargs):
@@ -46,10 +65,71 @@ class APIClient(
 
         self.config = config
 
+        # Endpoints are relative to the org URL, which a frozen config never
+        # changes, so build the common prefix once
+        self._url_prefix = f"{config.org_url}/"
+
+        # Retry idempotent requests that are rate limited or hit a transient
+        # server error. A Retry-After header sent by the server takes
+        # precedence over the jittered exponential backoff delay, and the
+        # time spent retrying a request is bounded by the configured timeout.
+        # Connections are kept alive and shared between threads, up to the
+        # configured pool size.
+        adapter = HTTPAdapter(
+            pool_maxsize=config.max_pool_size,
+            max_retries=DeadlineRetry(
+                deadline=config.timeout,
+                total=config.max_retries,
+                backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
+                jitter=DEFAULT_RETRY_JITTER,
+                status_forcelist=RETRY_STATUS_CODES,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
     def _get(self, endpoint: str) -> Dict[str, Any]:
         """
         Makes a GET request to the specified API endpoint.
 
+        List responses are paginated by the server; every ``next`` page is
+        fetched and its items merged into the first page, so callers always
+        receive the complete collection.
+
+        Args:
+            endpoint (str): The API endpoint to request
+
+        Returns:
+            dict: The JSON response from the API
+
+        Raises:
+            NotFound: If the resource is not found
+            APIError: If the API returns an error, or its ``next`` links
+                point outside the org or back to a page already fetched
+        """
+        data = self._get_page(endpoint)
+
+        fetched = {endpoint}
+        next_endpoint = self._next_page_endpoint(data)
+        while next_endpoint:
+            # A server handing out the same cursor again would otherwise
+            # keep this loop going forever
+            if next_endpoint in fetched:
+                raise APIError(f"Pagination loop at: {next_endpoint}")
+            fetched.add(next_endpoint)
+
+            page = self._get_page(next_endpoint)
+            data["items"].extend(page.get("items", []))
+            next_endpoint = self._next_page_endpoint(page)
+
+        return data
+
+    def _get_page(self, endpoint: str) -> dict[str, Any]:
+        """
+        Makes a single GET request to the specified API endpoint.
+
         Args:
             endpoint (str): The API endpoint to request
 
@@ -60,7 +140,7 @@ class APIClient(
             NotFound: If the resource is not found
             APIError: If the API returns an error
         """
-        resp = self.get(f"{self.config.org_url}/{endpoint}", headers=self._headers)
+        resp = self.get(self._url_prefix + endpoint, headers=self._headers)
 
         # Handle error responses
         if resp.status_code == 404:
@@ -68,8 +148,41 @@ class APIClient(
         elif resp.status_code >= 400:
             raise APIError(f"API error ({resp.status_code}): {resp.text}")
 
+        # Deployment payloads can be large, so decode with orjson when the
+        # optional ``fast`` extra is installed
+        if orjson is not None:
+            return orjson.loads(resp.content)
         return resp.json()
 
+    def _next_page_endpoint(self, data: Any) -> Optional[str]:
+        """
+        Returns the endpoint of the next page of a list response, if any.
+
+        Args:
+            data (Any): The JSON response from the API
+
+        Returns:
+            str, optional: The endpoint relative to the org URL, or ``None``
+                if this is the last page
+
+        Raises:
+            APIError: If the ``next`` link does not point into the org
+        """
+        if not isinstance(data, dict) or "items" not in data:
+            return None
+
+        for link in data.get("links") or []:
+            if link.get("rel") == "next":
+                # The href is either absolute or rooted at the API, so strip
+                # everything up to and including the org to make it relative
+                # to ``org_url``
+                href: str = link["href"]
+                for prefix in (self._url_prefix, f"/org/{self.config.org}/"):
+                    if href.startswith(prefix):
+                        return href[len(prefix) :]
+                raise APIError(f"Unexpected next page link: {href}")
+        return None
+
     def _delete(self, endpoint: str) -> requests.Response:
         """
         Makes a DELETE request to the specified API endpoint.
@@ -84,7 +197,7 @@ class APIClient(
             NotFound: If the resource is not found
             APIError: If the API returns an error
         """
-        resp = self.delete(f"{self.config.org_url}/{endpoint}", headers=self._headers)
+        resp = self.delete(self._url_prefix + endpoint, headers=self._headers)
 
         # Handle error responses
         if resp.status_code == 404:
@@ -111,7 +224,7 @@ class APIClient(
             APIError: If the API returns an error
         """
         resp = self.post(
-            f"{self.config.org_url}/{endpoint}",
+            self._url_prefix + endpoint,
             json=data,
             headers=self._headers,
         )
@@ -150,7 +263,7 @@ class APIClient(
             APIError: If the API returns an error
         """
         resp = self.patch(
-            f"{self.config.org_url}/{endpoint}",
+            self._url_prefix + endpoint,
             json=data,
             headers=self._headers,
         )
@@ -163,6 +276,7 @@ class APIClient(
 
         return resp
 
-    @property
+    @cached_property
     def _headers(self):
+        # The token is fixed for the life of the client, so build this once
         return {"Authorization": f"Bearer {self.config.token}"}
@@ -3,17 +3,21 @@ from dataclasses import asdict, dataclass
 from ..constants import (
     DEFAULT_CPLN_API_URL,
     DEFAULT_CPLN_API_VERSION,
+    DEFAULT_MAX_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT_SECONDS,
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class APIConfig:
     """
     Configuration class for the Control Plane API client.
 
     This class holds the configuration parameters needed to interact with the Control Plane API,
     including authentication details, organization information, and API settings.
+    Configs are immutable and hashable; use ``dataclasses.replace`` to derive a
+    modified copy.
 
     Args:
         token (str): Authorization token for accessing the API
@@ -21,6 +25,10 @@ class APIConfig:
         base_url (str, optional): Base URL for the Control Plane API. Defaults to DEFAULT_CPLN_API_URL
         version (str, optional): API version to use. Defaults to DEFAULT_CPLN_API_VERSION
         timeout (int, optional): Request timeout in seconds. Defaults to DEFAULT_TIMEOUT_SECONDS
+        max_retries (int, optional): Number of retries for idempotent requests that are
+            rate limited or hit a transient server error. Defaults to DEFAULT_MAX_RETRIES
+        max_pool_size (int, optional): Maximum number of connections to keep open to
+            the API server for reuse. Defaults to DEFAULT_MAX_POOL_SIZE
         org_url (str, optional): Organization-specific API URL. Will be automatically set based on base_url and org
     """
 
@@ -29,13 +37,16 @@ class APIConfig:
     base_url: str = DEFAULT_CPLN_API_URL
     version: str = DEFAULT_CPLN_API_VERSION
     timeout: int = DEFAULT_TIMEOUT_SECONDS
+    max_retries: int = DEFAULT_MAX_RETRIES
+    max_pool_size: int = DEFAULT_MAX_POOL_SIZE
     org_url: str = None
 
     def __post_init__(self):
         """
         Post-initialization hook that sets the organization URL.
         """
-        self.org_url = self.get_org_url()
+        # The config is frozen, so bypass the dataclass __setattr__
+        object.__setattr__(self, "org_url", self.get_org_url())
 
     def get_org_url(self) -> str:
         """
@@ -0,0 +1,92 @@
+import random
+import time
+from typing import Any, Optional
+
+# urllib3 1.x ships without type information; requests re-exports the same
+# class through its typed adapters module
+from requests.adapters import Retry
+
+
+class DeadlineRetry(Retry):
+    """
+    A retry policy whose retries share a single time budget.
+
+    Exponential backoff and ``Retry-After`` headers can add up to far more
+    than the caller is prepared to wait. The budget starts when the first
+    retry is scheduled; once it is spent the retries are exhausted, and no
+    sleep in between attempts is allowed to run past it.
+
+    Args:
+        deadline (float, optional): Total number of seconds that may be spent
+            retrying a single request. ``None`` disables the budget.
+        jitter (float, optional): Fraction of each backoff delay that is
+            randomized, so that clients throttled at the same moment do not
+            all retry in lockstep. ``0`` disables jitter.
+        **kwargs: Passed through to :class:`urllib3.util.retry.Retry`
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        deadline: Optional[float] = None,
+        jitter: float = 0.0,
+        expires_at: Optional[float] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.deadline = deadline
+        self.jitter = jitter
+        self.expires_at = expires_at
+
+    def new(self, **kw: Any) -> "DeadlineRetry":
+        """
+        Returns a copy of this policy for the next attempt.
+
+        The first copy, made when a request is retried for the first time,
+        starts the clock; later copies carry the same expiry forward.
+        """
+        expires_at = self.expires_at
+        if expires_at is None and self.deadline is not None:
+            expires_at = time.monotonic() + self.deadline
+        kw.setdefault("deadline", self.deadline)
+        kw.setdefault("jitter", self.jitter)
+        kw.setdefault("expires_at", expires_at)
+        retry: DeadlineRetry = super().new(**kw)
+        return retry
+
+    def remaining(self) -> Optional[float]:
+        """
+        Returns the number of seconds left in the budget.
+
+        Returns:
+            float, optional: The seconds remaining, or ``None`` if the budget
+                is disabled or has not started yet
+        """
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def is_exhausted(self) -> bool:
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            return True
+        exhausted: bool = super().is_exhausted()
+        return exhausted
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if self.jitter:
+            backoff *= 1 - self.jitter * random.random()
+        return self._cap(backoff)
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return self._cap(retry_after)
+
+    def _cap(self, delay: float) -> float:
+        remaining = self.remaining()
+        if remaining is None:
+            return delay
+        return min(delay, remaining)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     cast,
@@ -6,7 +7,7 @@ from typing import (
 from ..config import WorkloadConfig
 from ..parsers.deployment import Deployment
 
-IGNORED_CONTAINERS = ["cpln-mounter"]
+IGNORED_CONTAINERS = frozenset(("cpln-mounter",))
 
 
 class WorkloadDeploymentMixin:
@@ -79,6 +80,39 @@ class WorkloadApiMixin(WorkloadDeploymentMixin):
             endpoint += f"/{config.workload_id}"
         return cast(Any, self)._get(endpoint)
 
+    def get_workloads_bulk(
+        self, gvc: str, workload_ids: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves information about several workloads concurrently.
+
+        The requests are issued from a thread pool no larger than the
+        client's connection pool, so each one runs on a kept-alive connection.
+
+        Args:
+            gvc (str): The GVC the workloads belong to
+            workload_ids (list[str]): The workloads to retrieve
+
+        Returns:
+            list[dict]: Workload information, in the order of ``workload_ids``
+
+        Raises:
+            APIError: If any of the requests fails
+        """
+        if not workload_ids:
+            return []
+
+        max_workers = min(len(workload_ids), cast(Any, self).config.max_pool_size)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda workload_id: self.get_workload(
+                        WorkloadConfig(gvc=gvc, workload_id=workload_id)
+                    ),
+                    workload_ids,
+                )
+            )
+
     def create_workload(
         self,
         config: WorkloadConfig,
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional
 
 from .api import APIClient
 from .models import (
@@ -91,10 +91,29 @@ class CPLNClient:
             CPLNClient: A client configured from environment variables.
         """
         # Get configuration from environment variables
-        env_config = kwargs_from_env(**kwargs)
+        env_config = kwargs_from_env(kwargs.pop("environment", None))
 
-        # Create a new client instance with the environment configuration
-        return cls(**env_config)
+        # Create a new client instance with the environment configuration,
+        # letting explicit arguments such as timeout or max_pool_size through
+        return cls(**{**env_config, **kwargs})
+
+    def close(self) -> None:
+        """
+        Close the pooled connections held by the underlying API client.
+        """
+        self.api.close()
+
+    def __enter__(self) -> "CPLNClient":
+        """
+        Return the client itself for use in a ``with`` block.
+        """
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Close the client's pooled connections when the ``with`` block exits.
+        """
+        self.close()
 
     @property
     def gvcs(self):
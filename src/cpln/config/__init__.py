@@ -10,11 +10,14 @@ from typing import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class WorkloadConfig:
     """
     Configuration for workload operations.
 
+    Configs are immutable and hashable; use ``dataclasses.replace`` to derive a
+    modified copy.
+
     Attributes:
         gvc (str): Global Virtual Cluster name
         workload_id (Optional[str]): Workload identifier
@@ -16,3 +16,19 @@ DEFAULT_TIMEOUT_SECONDS = 60
 
 DEFAULT_CPLN_API_URL = "https://api.cpln.io"
 """str: The default Control Plane API base URL."""
+
+DEFAULT_MAX_POOL_SIZE = 10
+"""int: Default number of keep-alive connections kept open to the API server."""
+
+# Retry configuration
+DEFAULT_MAX_RETRIES = 3
+"""int: Default number of times an idempotent request is retried."""
+
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.5
+"""float: Base delay in seconds for exponential backoff between retries."""
+
+DEFAULT_RETRY_JITTER = 0.5
+"""float: Fraction of each retry backoff delay that is randomized."""
+
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+"""tuple: HTTP status codes that trigger a retry of an idempotent request."""
@@ -1,5 +1,6 @@
 import copy
 import random
+import re
 from typing import Any, Optional
 
 import inflection
@@ -12,6 +13,15 @@ from ..parsers.spec import Spec
 from ..utils import get_default_workload_template, load_template
 from .resource import Collection, Model
 
+VALID_WORKLOAD_TYPES = frozenset({"serverless", "standard", "cron"})
+
+# Match patterns like "100m", "1", "1.5", "2000m" but NOT bare integers like "100"
+# Valid: single digit integers ("1", "2"), decimal numbers ("1.5", "0.5"), or any integer with 'm' suffix ("100m", "2000m")
+CPU_SPEC_PATTERN = re.compile(r"^(\d\.\d+|\d+\.\d+|\d+m|[0-9])$")
+
+# Match patterns like "128Mi", "1Gi", "500M", "2G"
+MEMORY_SPEC_PATTERN = re.compile(r"^(\d+(\.\d+)?)(Mi|Gi|M|G|Ki|K|Ti|T)?$")
+
 
 class Workload(Model):
     """
@@ -378,11 +388,7 @@ class Workload(Model):
                 )
 
         # Validate workload_type
-        if workload_type is not None and workload_type not in [
-            "serverless",
-            "standard",
-            "cron",
-        ]:
+        if workload_type is not None and workload_type not in VALID_WORKLOAD_TYPES:
             raise ValueError(
                 "workload_type must be 'serverless', 'standard', or 'cron'"
             )
@@ -457,12 +463,7 @@ class Workload(Model):
         Raises:
             ValueError: If CPU specification is invalid
         """
-        import re
-
-        # Match patterns like "100m", "1", "1.5", "2000m" but NOT bare integers like "100"
-        # Valid: single digit integers ("1", "2"), decimal numbers ("1.5", "0.5"), or any integer with 'm' suffix ("100m", "2000m")
-        cpu_pattern = r"^(\d\.\d+|\d+\.\d+|\d+m|[0-9])$"
-        if not re.match(cpu_pattern, cpu):
+        if not CPU_SPEC_PATTERN.match(cpu):
             raise ValueError(
                 f"Invalid CPU specification '{cpu}'. "
                 "Expected format: decimal number (e.g., '1', '1.5') or integer with 'm' suffix (e.g., '100m', '2000m')"
@@ -478,11 +479,7 @@ class Workload(Model):
         Raises:
             ValueError: If memory specification is invalid
         """
-        import re
-
-        # Match patterns like "128Mi", "1Gi", "500M", "2G"
-        memory_pattern = r"^(\d+(\.\d+)?)(Mi|Gi|M|G|Ki|K|Ti|T)?$"
-        if not re.match(memory_pattern, memory):
+        if not MEMORY_SPEC_PATTERN.match(memory):
             raise ValueError(
                 f"Invalid memory specification '{memory}'. "
                 "Expected format: number followed by unit (e.g., '128Mi', '1Gi', '500M')"
@@ -693,10 +690,10 @@ class WorkloadCollection(Collection):
             raise ValueError("Either GVC or WorkloadConfig must be defined.")
 
         config = WorkloadConfig(gvc=gvc) if gvc else config
+        # The list endpoint already returns every workload in full, so build
+        # the models straight from the payload instead of issuing one GET per
+        # workload.
         resp = self.client.api.get_workload(config)["items"]
         return [
-            self.get(
-                config=WorkloadConfig(gvc=config.gvc, workload_id=workload["name"])
-            )
-            for workload in resp
+            self.prepare_model(workload, state={"gvc": config.gvc}) for workload in resp
         ]
@@ -409,6 +409,14 @@ class Deployment(BaseParser):
         )
 
     def get_replicas(self) -> dict[str, list[WorkloadReplica]]:
+        containers = self.get_containers()
+        if not containers:
+            return {}
+
+        # Every container runs in the same replicas, so look them up once
+        # rather than once per container
+        replicas = self.get_remote_deployment()["items"]
+        remote_wss = self.get_remote_wss()
         return {
             container_name: [
                 WorkloadReplica.parse(
@@ -416,13 +424,13 @@ class Deployment(BaseParser):
                         "name": replica,
                         "container": container_name,
                         "config": self.config,
-                        "remote_wss": self.get_remote_wss(),
+                        "remote_wss": remote_wss,
                         "api_config": self.api_client.config,
                     }
                 )
-                for replica in self.get_remote_deployment()["items"]
+                for replica in replicas
             ]
-            for container_name in self.get_containers()
+            for container_name in containers
         }
 
     def get_remote_wss(self) -> str:
@@ -2,7 +2,7 @@
 Tests for utility functions.
 """
 
-from examples.utils import safe_get_attr
+from examples.utils import _formats, safe_get_attr
 
 
 class TestObject:
@@ -87,3 +87,9 @@ def test_safe_get_attr_special_chars():
     assert safe_get_attr(obj, "special-chars") == "special"
     assert safe_get_attr(obj, "specialChars") == "special"
     assert safe_get_attr(obj, "SpecialChars") == "special"
+
+
+def test_formats_are_distinct():
+    """Test that formats collapsing to the same name are only probed once."""
+    assert _formats("camelCase") == ("camelCase", "camel_case", "CamelCase")
+    assert _formats("original") == ("original", "Original")
@@ -5,6 +5,11 @@ import pytest
 import requests
 from cpln.api.client import APIClient
 from cpln.api.config import APIConfig
+from cpln.constants import (
+    DEFAULT_MAX_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_TIMEOUT_SECONDS,
+)
 
 
 @pytest.fixture
@@ -21,6 +26,9 @@ def mock_config() -> Mock:
     mock.token = (
         os.getenv("CPLN_TOKEN") or "mock-token"
     )  # default mock token if not set
+    mock.timeout = DEFAULT_TIMEOUT_SECONDS
+    mock.max_retries = DEFAULT_MAX_RETRIES
+    mock.max_pool_size = DEFAULT_MAX_POOL_SIZE
 
     # Generate the org_url property
     mock.org_url = f"{mock.base_url}/org/{mock.org}"
@@ -29,7 +37,7 @@ def mock_config() -> Mock:
 
 
 @pytest.fixture
-def mock_api_client(mock_config: Mock) -> APIClient:
+def mock_api_client(mock_config: Mock, monkeypatch: pytest.MonkeyPatch) -> APIClient:
     """
     Create a properly mocked APIClient for testing.
 
@@ -64,6 +72,10 @@ def mock_api_client(mock_config: Mock) -> APIClient:
     mock_patch = Mock(return_value=mock_patch_response)
     mock_delete = Mock(return_value=mock_delete_response)
 
+    # The mock responses are configured through ``json()``, so always take
+    # the stdlib decoding path even when the optional orjson extra is present
+    monkeypatch.setattr("cpln.api.client.orjson", None)
+
     # Create the client with the mock config
     client = APIClient(config=mock_config)
 
@@ -2,7 +2,9 @@ import os
 from unittest.mock import Mock
 
 import pytest
+import requests
 from cpln.api.client import APIClient
+from cpln.constants import RETRY_STATUS_CODES
 from cpln.errors import APIError, NotFound
 
 
@@ -18,6 +20,25 @@ def test_api_client_headers(mock_config):
     client = APIClient(config=mock_config)
     headers = client._headers
     assert headers == {"Authorization": f"Bearer {os.getenv('CPLN_TOKEN')}"}
+    assert client._headers is headers
+
+
+def test_api_client_retry_adapter(mock_config):
+    client = APIClient(config=mock_config)
+    retries = client.get_adapter(mock_config.org_url).max_retries
+    assert retries.total == mock_config.max_retries
+    assert retries.respect_retry_after_header
+    assert set(RETRY_STATUS_CODES) == set(retries.status_forcelist)
+    # Non-idempotent requests are never retried
+    assert not retries.is_retry("POST", 429)
+    assert retries.is_retry("GET", 429)
+
+
+def test_api_client_pool_size(mock_config):
+    mock_config.max_pool_size = 32
+    client = APIClient(config=mock_config)
+    adapter = client.get_adapter(mock_config.org_url)
+    assert adapter._pool_maxsize == 32
 
 
 def test_api_client_get_gvc(mock_api_client):
@@ -70,6 +91,98 @@ def test_api_client_get_gvc_error(mock_api_client):
     )
 
 
+def test_api_client_get_follows_next_links(mock_api_client):
+    org = mock_api_client.config.org
+    first_page = Mock(spec=requests.Response)
+    first_page.status_code = 200
+    first_page.json.return_value = {
+        "kind": "list",
+        "items": [{"name": "gvc-1"}],
+        "links": [
+            {"rel": "self", "href": f"/org/{org}/gvc"},
+            {"rel": "next", "href": f"/org/{org}/gvc?cursor=abc"},
+        ],
+    }
+    last_page = Mock(spec=requests.Response)
+    last_page.status_code = 200
+    last_page.json.return_value = {
+        "kind": "list",
+        "items": [{"name": "gvc-2"}],
+        "links": [{"rel": "self", "href": f"/org/{org}/gvc?cursor=abc"}],
+    }
+    mock_api_client._mock_get.side_effect = [first_page, last_page]
+
+    result = mock_api_client.get_gvc()
+
+    assert [item["name"] for item in result["items"]] == ["gvc-1", "gvc-2"]
+    assert mock_api_client._mock_get.call_count == 2
+    assert mock_api_client._mock_get.call_args_list[1].args == (
+        f"{mock_api_client.config.org_url}/gvc?cursor=abc",
+    )
+
+
+def _list_page(items, next_href=None):
+    page = Mock(spec=requests.Response)
+    page.status_code = 200
+    page.json.return_value = {
+        "kind": "list",
+        "items": items,
+        "links": [{"rel": "next", "href": next_href}] if next_href else [],
+    }
+    return page
+
+
+def test_api_client_get_follows_absolute_next_links(mock_api_client):
+    org_url = mock_api_client.config.org_url
+    mock_api_client._mock_get.side_effect = [
+        _list_page([{"name": "gvc-1"}], f"{org_url}/gvc?cursor=abc"),
+        _list_page([{"name": "gvc-2"}]),
+    ]
+
+    result = mock_api_client.get_gvc()
+
+    assert [item["name"] for item in result["items"]] == ["gvc-1", "gvc-2"]
+    assert mock_api_client._mock_get.call_args_list[1].args == (
+        f"{org_url}/gvc?cursor=abc",
+    )
+
+
+def test_api_client_get_rejects_foreign_next_links(mock_api_client):
+    mock_api_client._mock_get.side_effect = [
+        _list_page([{"name": "gvc-1"}], "https://elsewhere.example.com/gvc?page=2"),
+    ]
+
+    with pytest.raises(APIError, match="Unexpected next page link"):
+        mock_api_client.get_gvc()
+    assert mock_api_client._mock_get.call_count == 1
+
+
+def test_api_client_get_stops_on_repeated_next_links(mock_api_client):
+    org = mock_api_client.config.org
+    mock_api_client._mock_get.side_effect = [
+        _list_page([{"name": "gvc-1"}], f"/org/{org}/gvc?cursor=abc"),
+        _list_page([{"name": "gvc-2"}], f"/org/{org}/gvc?cursor=abc"),
+        _list_page([{"name": "gvc-3"}]),
+    ]
+
+    with pytest.raises(APIError, match="Pagination loop"):
+        mock_api_client.get_gvc()
+    assert mock_api_client._mock_get.call_count == 2
+
+
+def test_api_client_get_uses_orjson_when_available(mock_api_client, monkeypatch):
+    mock_orjson = Mock()
+    mock_orjson.loads.return_value = {"data": "fast"}
+    monkeypatch.setattr("cpln.api.client.orjson", mock_orjson)
+    mock_api_client._mock_get_response.content = b'{"data": "fast"}'
+
+    result = mock_api_client.get_gvc()
+
+    mock_orjson.loads.assert_called_once_with(b'{"data": "fast"}')
+    mock_api_client._mock_get_response.json.assert_not_called()
+    assert result == {"data": "fast"}
+
+
 def test_api_client_get_image(mock_api_client):
     # Set up the mock response
     mock_api_client._mock_get_response.status_code = 200
@@ -1,3 +1,4 @@
+import dataclasses
 import os
 
 import pytest
@@ -5,6 +6,8 @@ from cpln.api.config import APIConfig
 from cpln.constants import (
     DEFAULT_CPLN_API_URL,
     DEFAULT_CPLN_API_VERSION,
+    DEFAULT_MAX_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
     DEFAULT_TIMEOUT_SECONDS,
 )
 
@@ -20,6 +23,8 @@ def test_api_config_default_values():
     assert config.token == os.getenv("CPLN_TOKEN")
     assert config.version == DEFAULT_CPLN_API_VERSION
     assert config.timeout is DEFAULT_TIMEOUT_SECONDS
+    assert config.max_retries == DEFAULT_MAX_RETRIES
+    assert config.max_pool_size == DEFAULT_MAX_POOL_SIZE
 
 
 def test_api_config_custom_values():
@@ -69,6 +74,22 @@ def test_api_config_asdict():
         "token": os.getenv("CPLN_TOKEN"),
         "version": DEFAULT_CPLN_API_VERSION,
         "timeout": DEFAULT_TIMEOUT_SECONDS,
+        "max_retries": DEFAULT_MAX_RETRIES,
+        "max_pool_size": DEFAULT_MAX_POOL_SIZE,
         "org_url": f"{os.getenv('CPLN_BASE_URL')}/org/{os.getenv('CPLN_ORG')}",
     }
     assert config.asdict() == config_dict
+
+
+def test_api_config_is_frozen():
+    config = APIConfig(org="test-org", token="test-token")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.org = "other-org"
+    assert hash(config) == hash(APIConfig(org="test-org", token="test-token"))
+
+
+def test_api_config_replace_updates_org_url():
+    config = APIConfig(org="test-org", token="test-token")
+    replaced = dataclasses.replace(config, base_url="https://remote.example.com")
+    assert replaced.org_url == "https://remote.example.com/org/test-org"
+    assert config.org_url == f"{DEFAULT_CPLN_API_URL}/org/test-org"
@@ -0,0 +1,66 @@
+from unittest.mock import Mock, patch
+
+from cpln.api.retry import DeadlineRetry
+
+
+def _retry_after_response(seconds):
+    response = Mock()
+    response.headers = {"Retry-After": str(seconds)}
+    response.getheader.side_effect = response.headers.get
+    return response
+
+
+def test_deadline_starts_on_first_retry():
+    retry = DeadlineRetry(deadline=10, total=3)
+    assert retry.remaining() is None
+
+    with patch("cpln.api.retry.time.monotonic", return_value=100.0):
+        retry = retry.increment(method="GET", url="/gvc")
+
+    assert retry.expires_at == 110.0
+    # The expiry is carried forward rather than restarted
+    with patch("cpln.api.retry.time.monotonic", return_value=105.0):
+        retry = retry.increment(method="GET", url="/gvc")
+        assert retry.expires_at == 110.0
+        assert retry.remaining() == 5.0
+
+
+def test_deadline_exhausts_retries():
+    retry = DeadlineRetry(deadline=10, total=3, expires_at=110.0)
+
+    with patch("cpln.api.retry.time.monotonic", return_value=109.0):
+        assert not retry.is_exhausted()
+    with patch("cpln.api.retry.time.monotonic", return_value=110.0):
+        assert retry.is_exhausted()
+
+
+def test_deadline_caps_retry_after():
+    retry = DeadlineRetry(
+        deadline=10, total=3, expires_at=110.0, respect_retry_after_header=True
+    )
+
+    with patch("cpln.api.retry.time.monotonic", return_value=108.0):
+        assert retry.get_retry_after(_retry_after_response(30)) == 2.0
+        assert retry.get_retry_after(_retry_after_response(1)) == 1.0
+
+
+def test_no_deadline_behaves_like_retry():
+    retry = DeadlineRetry(total=3, backoff_factor=0.5)
+    retry = retry.increment(method="GET", url="/gvc")
+    retry = retry.increment(method="GET", url="/gvc")
+
+    assert retry.remaining() is None
+    assert not retry.is_exhausted()
+    assert retry.get_backoff_time() == 1.0
+
+
+def test_jitter_randomizes_backoff():
+    retry = DeadlineRetry(total=3, backoff_factor=0.5, jitter=0.5)
+    retry = retry.increment(method="GET", url="/gvc")
+    retry = retry.increment(method="GET", url="/gvc")
+    assert retry.jitter == 0.5
+
+    with patch("cpln.api.retry.random.random", return_value=0.0):
+        assert retry.get_backoff_time() == 1.0
+    with patch("cpln.api.retry.random.random", return_value=1.0):
+        assert retry.get_backoff_time() == 0.5
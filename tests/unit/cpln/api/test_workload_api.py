@@ -17,6 +17,7 @@ class TestWorkloadDeploymentMixin:
         self.mixin.config = MagicMock(spec=APIConfig)
         self.mixin.config.token = "test-token"
         self.mixin.config.org = "test-org"
+        self.mixin.config.max_pool_size = 10
         self.mixin.config.asdict.return_value = {
             "base_url": "https://api.cpln.io",
             "token": "test-token",
@@ -136,6 +137,7 @@ class TestWorkloadApiMixin:
         self.mixin.config = MagicMock(spec=APIConfig)
         self.mixin.config.token = "test-token"
         self.mixin.config.org = "test-org"
+        self.mixin.config.max_pool_size = 10
 
         self.config: WorkloadConfig = WorkloadConfig(
             gvc="test-gvc", workload_id="test-workload", location="test-location"
@@ -162,6 +164,24 @@ class TestWorkloadApiMixin:
         self.mixin._get.assert_called_once_with("gvc/test-gvc/workload")
         assert result == {"items": [{"name": "workload1"}, {"name": "workload2"}]}
 
+    def test_get_workloads_bulk(self) -> None:
+        """Test get_workloads_bulk method"""
+        self.mixin._get.side_effect = lambda endpoint: {
+            "name": endpoint.rsplit("/", 1)[-1]
+        }
+
+        result = self.mixin.get_workloads_bulk("test-gvc", ["workload1", "workload2"])
+
+        assert self.mixin._get.call_count == 2
+        self.mixin._get.assert_any_call("gvc/test-gvc/workload/workload1")
+        self.mixin._get.assert_any_call("gvc/test-gvc/workload/workload2")
+        assert result == [{"name": "workload1"}, {"name": "workload2"}]
+
+    def test_get_workloads_bulk_empty(self) -> None:
+        """Test get_workloads_bulk method without workload IDs"""
+        assert self.mixin.get_workloads_bulk("test-gvc", []) == []
+        self.mixin._get.assert_not_called()
+
     def test_create_workload(self) -> None:
         """Test create_workload method"""
         metadata: dict[str, str] = {
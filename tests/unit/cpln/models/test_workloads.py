@@ -1131,12 +1131,8 @@ class TestWorkloadCollection(unittest.TestCase):
             {"name": "workload2", "spec": {"type": "serverless"}},
         ]
 
-        # Mock API responses
-        self.client.api.get_workload.side_effect = [
-            {"items": workloads},  # First call returns list
-            workloads[0],  # Second call returns workload1
-            workloads[1],  # Third call returns workload2
-        ]
+        # Mock API response: the list endpoint returns the full workloads
+        self.client.api.get_workload.return_value = {"items": workloads}
 
         # Call list method
         result = self.collection.list(gvc=gvc)
@@ -1154,8 +1150,8 @@ class TestWorkloadCollection(unittest.TestCase):
         self.assertEqual(result[1].attrs, workloads[1])
         self.assertEqual(result[1].state["gvc"], gvc)
 
-        # Verify API calls
-        self.assertEqual(self.client.api.get_workload.call_count, 3)
+        # Verify a single API call was made
+        self.assertEqual(self.client.api.get_workload.call_count, 1)
 
     def test_list_with_config(self) -> None:
         """Test list method with config parameter"""
@@ -1166,12 +1162,8 @@ class TestWorkloadCollection(unittest.TestCase):
             {"name": "workload2", "spec": {"type": "serverless"}},
         ]
 
-        # Mock API responses
-        self.client.api.get_workload.side_effect = [
-            {"items": workloads},  # First call returns list
-            workloads[0],  # Second call returns workload1
-            workloads[1],  # Third call returns workload2
-        ]
+        # Mock API response: the list endpoint returns the full workloads
+        self.client.api.get_workload.return_value = {"items": workloads}
 
         # Call list method
         result = self.collection.list(config=config)
@@ -1180,8 +1172,8 @@ class TestWorkloadCollection(unittest.TestCase):
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 2)
 
-        # Verify API calls
-        self.assertEqual(self.client.api.get_workload.call_count, 3)
+        # Verify a single API call was made
+        self.assertEqual(self.client.api.get_workload.call_count, 1)
 
         # Check first call was with the original config
         first_call = self.client.api.get_workload.call_args_list[0]
@@ -627,6 +627,28 @@ class TestDeployment:
             assert isinstance(result, dict)
             assert "container1" in result
             assert "container2" in result
+            assert mock_parse.call_count == 4
+
+        # The replicas are shared by every container, so they are fetched once
+        deployment.get_remote_deployment.assert_called_once()
+        deployment.get_remote_wss.assert_called_once()
+
+    def test_get_replicas_without_containers(self):
+        """Test get_replicas skips the remote lookup when there are no containers."""
+        deployment = Deployment(
+            name="test",
+            status=Mock(),
+            last_modified="2023-01-01T00:00:00Z",
+            kind="Deployment",
+            links=[],
+            api_client=self.api_client,
+            config=self.workload_config,
+        )
+        deployment.get_remote_deployment = Mock()
+        deployment.get_containers = Mock(return_value={})
+
+        assert deployment.get_replicas() == {}
+        deployment.get_remote_deployment.assert_not_called()
 
     def test_real_post_init_coverage(self):
         """Test the actual __post_init__ method without mocking to ensure line 346 is covered."""
@@ -55,6 +55,31 @@ class TestCPLNClientIntegration(unittest.TestCase):
             self.assertIsInstance(client.gvcs, GVCCollection)
             self.assertEqual(client.gvcs.client, client)
 
+    def test_client_from_env_forwards_arguments(self) -> None:
+        """Test that from_env passes explicit arguments on to the APIClient"""
+        env_vars = {"CPLN_TOKEN": "env-token", "CPLN_ORG": "env-org"}
+
+        with unittest.mock.patch("cpln.client.APIClient") as mock_api_client:
+            CPLNClient.from_env(environment=env_vars, timeout=5, max_pool_size=32)
+
+        kwargs = mock_api_client.call_args.kwargs
+        self.assertEqual(kwargs["token"], "env-token")
+        self.assertEqual(kwargs["org"], "env-org")
+        self.assertEqual(kwargs["timeout"], 5)
+        self.assertEqual(kwargs["max_pool_size"], 32)
+
+    def test_client_close(self) -> None:
+        """Test that closing the client closes the API session"""
+        self.client.close()
+        self.client.api.close.assert_called_once_with()
+
+    def test_client_context_manager(self) -> None:
+        """Test that the client closes the API session on exit"""
+        with self.client as client:
+            self.assertIs(client, self.client)
+            self.client.api.close.assert_not_called()
+        self.client.api.close.assert_called_once_with()
+
 
 if __name__ == "__main__":
     unittest.main()